@@ -16,6 +16,14 @@ Features:
 import pygame
 import random
 import sys
+from bisect import bisect_right
+
+# NumPy is optional: when present, meteor spawn randomness is sampled in
+# one vectorized batch instead of several scalar draws per spawn
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 # Initialize pygame
 pygame.init()
@@ -52,6 +60,18 @@ MAX_LASER_COOLDOWN = 800  # Maximum laser cooldown (milliseconds)
 # Life system
 INITIAL_LIVES = 3  # Number of hearts/lives at game start
 
+# Meteor lifetime limits (precomputed so the per-meteor check is a bare compare)
+METEOR_MAX_AGE = 5000  # Milliseconds a meteor may live before despawning
+METEOR_KILL_Y = WINDOW_HEIGHT + 100  # Vertical cutoff below the screen
+
+# Custom events: SDL timers deliver these through the event queue instead of
+# the main loop polling elapsed time every frame
+METEOR_SPAWN_EVENT = pygame.USEREVENT + 1
+SURVIVAL_SCORE_EVENT = pygame.USEREVENT + 2
+
+# Screen bounds used to clamp the player, created once instead of per frame
+SCREEN_RECT = pygame.FRect(0, 0, WINDOW_WIDTH, WINDOW_HEIGHT)
+
 # Display setup
 display_surface = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
 pygame.display.set_caption("Space Shooter")
@@ -62,23 +82,28 @@ clock = pygame.time.Clock()
 # ------------------------
 # Images
 try:
-    # Player and projectiles
+    # Player and projectiles. The laser is premultiplied once at load so
+    # its many per-frame blits can use the fast BLEND_PREMULTIPLIED path;
+    # premultiplying leaves the alpha channel untouched, so masks built
+    # from the surface are unaffected.
     player_surf = pygame.image.load("images/player.png").convert_alpha()
-    laser_surf = pygame.image.load("images/laser.png").convert_alpha()
+    laser_surf = pygame.image.load("images/laser.png").convert_alpha().premul_alpha()
 
     # Environment
     star_surf = pygame.image.load("images/star.png").convert_alpha()
     meteor_surf = pygame.image.load("images/meteor.png").convert_alpha()
 
-    # UI elements
+    # UI elements (convert_alpha so blits use the display's pixel format)
     heart_full_surf = pygame.Surface((30, 30), pygame.SRCALPHA)
     pygame.draw.polygon(heart_full_surf, (255, 0, 0), [(15, 5), (25, 15), (15, 25), (5, 15)])
+    heart_full_surf = heart_full_surf.convert_alpha()
     heart_empty_surf = pygame.Surface((30, 30), pygame.SRCALPHA)
     pygame.draw.polygon(heart_empty_surf, (100, 100, 100), [(15, 5), (25, 15), (15, 25), (5, 15)], 2)
+    heart_empty_surf = heart_empty_surf.convert_alpha()
 
-    # Animation frames
+    # Animation frames (premultiplied for the same fast blend path as the laser)
     explosion_frames = [
-        pygame.image.load(f"images/explosion/{i}.png").convert_alpha()
+        pygame.image.load(f"images/explosion/{i}.png").convert_alpha().premul_alpha()
         for i in range(21)
     ]
 except pygame.error as e:
@@ -87,6 +112,22 @@ except pygame.error as e:
     pygame.quit()
     sys.exit()
 
+# Collision masks for surfaces that never change, computed once at load time
+# so individual sprites don't have to re-scan the pixels on creation
+PLAYER_MASK = pygame.mask.from_surface(player_surf)
+LASER_MASK = pygame.mask.from_surface(laser_surf)
+
+# Rotated meteor frames, pre-built at load time in 5 degree steps so meteor
+# rotation at runtime is a pure table lookup shared by every meteor.
+# 72 small surfaces plus masks — negligible memory, no first-use hitch.
+ROTATION_BUCKET_SIZE = 5  # Degrees per frame-table entry
+METEOR_ROT_FRAMES = [
+    pygame.transform.rotozoom(meteor_surf, angle, 1).convert_alpha()
+    for angle in range(0, 360, ROTATION_BUCKET_SIZE)
+]
+METEOR_ROT_MASKS = [pygame.mask.from_surface(frame) for frame in METEOR_ROT_FRAMES]
+METEOR_ROT_SIZES = [frame.get_size() for frame in METEOR_ROT_FRAMES]
+
 # Fonts
 try:
     main_font = pygame.font.Font("images/Frank.ttf", 32)
@@ -123,15 +164,27 @@ except pygame.error as e:
 # SPRITE CLASSES
 # ------------------------
 
+# All 9 possible raw input states and their normalized directions,
+# precomputed so input handling needs no sqrt and no Vector2 allocation
+_DIAGONAL = 0.7071067811865476  # 1 / sqrt(2)
+_DIRECTION_TABLE = {
+    (-1, -1): (-_DIAGONAL, -_DIAGONAL), (0, -1): (0, -1), (1, -1): (_DIAGONAL, -_DIAGONAL),
+    (-1, 0): (-1, 0), (0, 0): (0, 0), (1, 0): (1, 0),
+    (-1, 1): (-_DIAGONAL, _DIAGONAL), (0, 1): (0, 1), (1, 1): (_DIAGONAL, _DIAGONAL),
+}
+
+
 class Player(pygame.sprite.Sprite):
     """Player spaceship that can move and shoot lasers"""
+    __slots__ = ('image', 'rect', 'mask', 'direction', 'speed',
+                 'can_shoot', 'laser_cooldown', 'laser_shoot_time', 'lives', 'alive')
 
     def __init__(self):
         super().__init__()
         # Visual and positioning
         self.image = player_surf
         self.rect = self.image.get_frect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2))
-        self.mask = pygame.mask.from_surface(self.image)  # For pixel-perfect collision
+        self.mask = PLAYER_MASK  # For pixel-perfect collision (shared, precomputed)
 
         # Movement
         self.direction = pygame.math.Vector2()
@@ -146,19 +199,16 @@ class Player(pygame.sprite.Sprite):
         self.lives = INITIAL_LIVES
         self.alive = True
 
-    def input(self):
+    def input(self, keys):
         """Process keyboard input for movement"""
-        keys = pygame.key.get_pressed()
-
         # Horizontal movement: D (right) - A (left)
-        self.direction.x = int(keys[pygame.K_d]) - int(keys[pygame.K_a])
+        dx = int(keys[pygame.K_d]) - int(keys[pygame.K_a])
 
         # Vertical movement: S (down) - W (up)
-        self.direction.y = int(keys[pygame.K_s]) - int(keys[pygame.K_w])
+        dy = int(keys[pygame.K_s]) - int(keys[pygame.K_w])
 
-        # Normalize for consistent diagonal speed
-        if self.direction.length_squared() > 0:
-            self.direction = self.direction.normalize()
+        # Look up the pre-normalized direction (consistent diagonal speed)
+        self.direction.x, self.direction.y = _DIRECTION_TABLE[(dx, dy)]
 
     def move(self, dt):
         """Move the player based on current direction and delta time"""
@@ -169,29 +219,26 @@ class Player(pygame.sprite.Sprite):
         self.rect.centery += self.direction.y * self.speed * dt
 
         # Keep player within screen bounds
-        self.rect.clamp_ip(pygame.FRect(0, 0, WINDOW_WIDTH, WINDOW_HEIGHT))
+        self.rect.clamp_ip(SCREEN_RECT)
 
-    def shoot_laser(self):
+    def shoot_laser(self, just_pressed, now):
         """Create a new laser if cooldown has expired"""
-        recent_keys = pygame.key.get_just_pressed()
-
-        if recent_keys[pygame.K_SPACE] and self.can_shoot:
+        if just_pressed[pygame.K_SPACE] and self.can_shoot:
             # Create new laser at player's position
-            Laser(laser_surf, self.rect.midtop, (all_sprites, laser_sprites))
+            laser_sprites.append(Laser(laser_surf, self.rect.midtop))
 
             # Play sound effect
             laser_sound.play()
 
             # Start cooldown
             self.can_shoot = False
-            self.laser_shoot_time = pygame.time.get_ticks()
+            self.laser_shoot_time = now
 
-    def laser_timer(self):
+    def laser_timer(self, now):
         """Manage cooldown timer for shooting lasers"""
         if not self.can_shoot:
-            current_time = pygame.time.get_ticks()
             # Check if cooldown period has passed
-            if current_time - self.laser_shoot_time >= self.laser_cooldown:
+            if now - self.laser_shoot_time >= self.laser_cooldown:
                 self.can_shoot = True
 
     def take_damage(self):
@@ -215,132 +262,145 @@ class Player(pygame.sprite.Sprite):
             self.laser_cooldown = min(new_cooldown, MAX_LASER_COOLDOWN)
             # print(f"Laser cooldown: {self.laser_cooldown}")
 
-    def update(self, dt, current_level):
+    def update(self, dt, now, current_level, keys, just_pressed):
         """Update player state for the current frame"""
-        self.input()
+        self.input(keys)
         self.move(dt)
-        self.shoot_laser()
-        self.laser_timer()
+        self.shoot_laser(just_pressed, now)
+        self.laser_timer(now)
         self.update_laser_cooldown(current_level)
 
 
-class Star(pygame.sprite.Sprite):
-    """Background star decoration"""
-
-    def __init__(self, surf, groups):
-        super().__init__(groups)
-        self.image = surf
-
-        # Random position within the screen
-        self.rect = self.image.get_frect(center=(
-            random.randint(0, WINDOW_WIDTH),
-            random.randint(0, WINDOW_HEIGHT)
-        ))
-
-        # Stars remain stationary so no update logic needed
-
-    def update(self, dt):
-        """Stars don't move, but this is required for sprite group compatibility"""
-        pass
-
-
 class Laser(pygame.sprite.Sprite):
     """Player projectile that moves upward and damages meteors"""
+    __slots__ = ('image', 'rect', 'speed', 'mask', 'alive')
 
-    def __init__(self, surf, pos, groups):
-        super().__init__(groups)
+    def __init__(self, surf, pos):
+        super().__init__()
         self.image = surf
         self.rect = self.image.get_frect(midbottom=pos)
         self.speed = 700
-        self.mask = pygame.mask.from_surface(self.image)  # For pixel-perfect collision
+        self.mask = LASER_MASK  # For pixel-perfect collision (shared, precomputed)
+        self.alive = True  # Cleared when the laser leaves the list
 
-    def update(self, dt):
-        """Move laser upward and destroy if off-screen"""
+    def update(self, dt, now):
+        """Move laser upward and flag for removal if off-screen"""
         # Move upward
         self.rect.centery -= self.speed * dt
 
         # Remove if it moves off the top of the screen
         if self.rect.bottom < 0:
-            self.kill()
+            self.alive = False
+
+
+# Meteor spawn parameters are handed out from a pre-sampled pool of uniform
+# [0, 1) rows — (x, y, drift, rotation speed) — refilled in one batch when
+# exhausted rather than drawing three scalars per spawn
+_SPAWN_POOL_SIZE = 1024
+_spawn_pool = []
+_numpy_rng = np.random.default_rng() if np is not None else None
+
+
+def next_spawn_params():
+    """Return one (x, y, drift, rot_speed) row of uniform [0, 1) samples"""
+    if not _spawn_pool:
+        # Refill the whole pool at once; vectorized when NumPy is around
+        if _numpy_rng is not None:
+            _spawn_pool.extend(_numpy_rng.random((_SPAWN_POOL_SIZE, 4)).tolist())
+        else:
+            _spawn_pool.extend(
+                (random.random(), random.random(), random.random(), random.random())
+                for _ in range(_SPAWN_POOL_SIZE)
+            )
+    return _spawn_pool.pop()
 
 
 class Meteor(pygame.sprite.Sprite):
     """Enemy object that falls from the top of the screen"""
+    __slots__ = ('image', 'rect', 'mask', 'speed', 'velocity_x',
+                 'velocity_y', 'rotation_speed', 'rotation', 'creation_time', 'alive')
 
-    def __init__(self, surf, groups, speed_multiplier=1.0):
-        super().__init__(groups)
-        # Store original surface for rotation without quality loss
-        self.original_surf = surf
-        self.image = self.original_surf
+    def __init__(self, speed_multiplier=1.0):
+        super().__init__()
+        # Start on the unrotated frame of the shared rotation table
+        self.image = METEOR_ROT_FRAMES[0]
+
+        # Scale one pre-sampled row into this meteor's random parameters
+        x_norm, y_norm, drift_norm, rot_norm = next_spawn_params()
 
         # Position meteor randomly above the visible screen
         self.rect = self.image.get_frect(center=(
-            random.randint(0, WINDOW_WIDTH - self.image.get_width()),
-            random.randint(-200, -50)  # Start above the screen
+            x_norm * (WINDOW_WIDTH - self.image.get_width()),
+            -200 + y_norm * 150  # Start above the screen
         ))
 
-        # Movement parameters
+        # Movement parameters stored as plain floats so the per-frame update
+        # is scalar arithmetic with no intermediate Vector2 allocations
         self.speed = 500 * speed_multiplier  # Base speed modified by difficulty
-        self.direction = pygame.math.Vector2(
-            random.uniform(-0.5, 0.5),  # Random horizontal drift
-            1  # Always moving downward
-        )
+        self.velocity_x = (drift_norm - 0.5) * self.speed  # Random horizontal drift
+        self.velocity_y = self.speed  # Always moving downward
 
         # Rotation parameters
-        self.rotation_speed = random.randint(50, 300)  # Degrees per second
+        self.rotation_speed = 50 + rot_norm * 250  # Degrees per second
         self.rotation = 0  # Current rotation angle
 
         # Time tracking
         self.creation_time = pygame.time.get_ticks()
 
-        # Collision detection
-        self.mask = pygame.mask.from_surface(self.image)  # For pixel-perfect collision
+        # Collision detection (shared mask from the rotation table)
+        self.mask = METEOR_ROT_MASKS[0]
 
-    def update(self, dt):
-        """Update meteor position, rotation, and destroy if off-screen too long"""
-        # Move based on direction, speed and time
-        self.rect.center += self.direction * self.speed * dt
+        # Cleared when the meteor is destroyed or expires
+        self.alive = True
 
-        # Rotate the meteor
-        self.rotation += self.rotation_speed * dt
-        self.image = pygame.transform.rotozoom(self.original_surf, self.rotation, 1)
+    def update(self, dt, now):
+        """Update meteor position, rotation, and flag for removal when expired"""
+        # Move based on velocity and time (in-place, no temporary vectors)
+        self.rect.centerx += self.velocity_x * dt
+        self.rect.centery += self.velocity_y * dt
 
-        # Update mask for the rotated image
-        self.mask = pygame.mask.from_surface(self.image)
+        # Rotate the meteor by indexing the pre-built frame table
+        self.rotation += self.rotation_speed * dt
+        bucket = int(self.rotation / ROTATION_BUCKET_SIZE) % len(METEOR_ROT_FRAMES)
+        self.image = METEOR_ROT_FRAMES[bucket]
+        self.mask = METEOR_ROT_MASKS[bucket]
 
-        # Keep the rect centered at the same position after rotation
-        old_center = self.rect.center
-        self.rect = self.image.get_frect(center=old_center)
+        # Re-fit the rect to the rotated frame in place, keeping the same
+        # center — avoids building a new FRect per meteor per frame
+        center = self.rect.center
+        self.rect.size = METEOR_ROT_SIZES[bucket]
+        self.rect.center = center
 
         # Check if meteor has been alive too long or is far below screen
-        current_time = pygame.time.get_ticks()
-        if current_time - self.creation_time >= 5000 or self.rect.top > WINDOW_HEIGHT + 100:
-            self.kill()
+        if now - self.creation_time >= METEOR_MAX_AGE or self.rect.top > METEOR_KILL_Y:
+            self.alive = False
 
 
 class AnimatedExplosion(pygame.sprite.Sprite):
     """Explosion animation played when a meteor is destroyed"""
+    __slots__ = ('frames', 'start_time', 'image', 'rect', 'animation_speed')
 
     def __init__(self, frames, pos, groups):
         super().__init__(groups)
         self.frames = frames  # List of animation frame images
-        self.index = 0  # Current frame index
-        self.image = self.frames[self.index]
+        self.start_time = pygame.time.get_ticks()  # Animation start, milliseconds
+        self.image = self.frames[0]
         self.rect = self.image.get_frect(center=pos)
         self.animation_speed = 30  # Frames per second
 
         # Play explosion sound
         explosion_sound.play()
 
-    def update(self, dt):
+    def update(self, dt, now):
         """Advance animation frames based on time elapsed"""
-        # Increment frame index
-        self.index += self.animation_speed * dt
+        # Integer frame index derived from elapsed milliseconds: no float
+        # accumulator to drift and no per-frame int() coercion
+        frame = (now - self.start_time) * self.animation_speed // 1000
 
         # Check if animation should continue
-        if self.index < len(self.frames):
+        if frame < len(self.frames):
             # Show current frame
-            self.image = self.frames[int(self.index)]
+            self.image = self.frames[frame]
         else:
             # End animation when all frames are shown
             self.kill()
@@ -350,20 +410,30 @@ class AnimatedExplosion(pygame.sprite.Sprite):
 # GAME MANAGEMENT FUNCTIONS
 # -----------------------
 
-def spawn_stars(count=20):
-    """Create initial background stars"""
-    for _ in range(count):
-        Star(star_surf, all_sprites)
+def create_background(star_count=20):
+    """Build the static background: fill color with randomly placed stars
+
+    Stars never move, so they are baked into one full-screen surface and
+    the per-frame background cost becomes a single blit.
+    """
+    background = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
+    background.fill(BACKGROUND_COLOR)
+
+    for _ in range(star_count):
+        star_rect = star_surf.get_frect(center=(
+            random.randint(0, WINDOW_WIDTH),
+            random.randint(0, WINDOW_HEIGHT)
+        ))
+        background.blit(star_surf, star_rect)
+
+    return background.convert()
 
 
 def get_current_level(score):
     """Determine current level based on score"""
-    for i, threshold in enumerate(LEVEL_THRESHOLDS):
-        if score < threshold:
-            return i  # Return level index (0-based)
-
-    # If score exceeds all thresholds, return max level
-    return len(LEVEL_THRESHOLDS)
+    # Thresholds are sorted, so a binary search finds the level directly;
+    # scores past the last threshold are capped at the maximum level
+    return min(bisect_right(LEVEL_THRESHOLDS, score), MAX_LEVEL)
 
 
 def calculate_meteor_spawn_time(level):
@@ -376,21 +446,54 @@ def calculate_meteor_spawn_time(level):
     return max(spawn_time, MIN_METEOR_SPAWN_RATE)
 
 
+def collide_rect_then_mask(sprite_a, sprite_b):
+    """Cheap bounding-box test first, pixel-perfect mask test only on overlap
+
+    pygame.sprite.collide_mask runs the full mask overlap for every pair,
+    but in the typical frame almost all pairs are nowhere near each other,
+    so the rect pre-filter rejects them without touching any pixels.
+    """
+    if not sprite_a.rect.colliderect(sprite_b.rect):
+        return False
+    return pygame.sprite.collide_mask(sprite_a, sprite_b)
+
+
 def check_collisions(player, score):
-    """Handle all collision detection and responses"""
-    # Player-meteor collision
-    if pygame.sprite.spritecollide(player, meteor_sprites, True, pygame.sprite.collide_mask):
+    """Handle all collision detection and responses
+
+    Meteors and lasers live in plain lists; hits only clear the alive
+    flag and the main loop compacts the lists once per frame.
+    """
+    # Player-meteor collision (one hit per frame, however many meteors)
+    player_hit = False
+    for meteor in meteor_sprites:
+        if meteor.alive and collide_rect_then_mask(player, meteor):
+            meteor.alive = False
+            player_hit = True
+    if player_hit:
         player.take_damage()
 
-    # Laser-meteor collisions
+    # Laser-meteor collisions (skip entirely when nothing can collide)
+    if not meteor_sprites:
+        return score
+
     for laser in laser_sprites:
-        meteors_hit = pygame.sprite.spritecollide(laser, meteor_sprites, True, pygame.sprite.collide_mask)
-        if meteors_hit:
+        # Lasers flagged dead this frame (flew off-screen) can't hit anything
+        if not laser.alive:
+            continue
+
+        laser_hit = False
+        for meteor in meteor_sprites:
+            if meteor.alive and collide_rect_then_mask(laser, meteor):
+                meteor.alive = False
+                laser_hit = True
+
+        if laser_hit:
             # Create explosion animation at collision position
-            AnimatedExplosion(explosion_frames, laser.rect.midtop, all_sprites)
+            AnimatedExplosion(explosion_frames, laser.rect.midtop, explosion_sprites)
 
             # Remove the laser
-            laser.kill()
+            laser.alive = False
 
             # Award points for destroying meteor
             score += METEOR_DESTRUCTION_POINTS
@@ -398,81 +501,117 @@ def check_collisions(player, score):
     return score
 
 
+# Font rendering is the expensive part of the UI, so rendered text is
+# cached and only rebuilt when the underlying value actually changes
+_score_text_cache = (None, None, None)  # (score, surface, rect)
+_level_text_cache = (None, None, None)  # (level, surface, rect)
+
+# Heart positions never change; lay them out once (right-aligned, 40px apart)
+HEART_SPACING = 40  # Pixels between hearts
+HEART_RECTS = [
+    heart_full_surf.get_frect(topright=(WINDOW_WIDTH - HEART_SPACING * (INITIAL_LIVES - i), 20))
+    for i in range(INITIAL_LIVES)
+]
+
+
 def display_ui(surface, score, level, lives):
     """Draw all UI elements (score, level indicator, and hearts)"""
-    # Display score at bottom center
-    score_surf = main_font.render(f"Score: {score}", True, UI_TEXT_COLOR)
-    score_rect = score_surf.get_frect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT - 50))
+    global _score_text_cache, _level_text_cache
+
+    # Display score at bottom center (re-render only when the score changes)
+    if _score_text_cache[0] != score:
+        score_surf = main_font.render(f"Score: {score}", True, UI_TEXT_COLOR)
+        score_rect = score_surf.get_frect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT - 50))
+        _score_text_cache = (score, score_surf, score_rect)
+    _, score_surf, score_rect = _score_text_cache
     surface.blit(score_surf, score_rect)
 
     # Add decorative background for score
     pygame.draw.rect(surface, '#aaaaaa', score_rect.inflate(50, 20), 2, 10)
 
-    # Display level at top left
-    level_surf = main_font.render(f"Level: {level}", True, UI_TEXT_COLOR)
-    level_rect = level_surf.get_frect(topleft=(20, 20))
+    # Display level at top left (re-render only when the level changes)
+    if _level_text_cache[0] != level:
+        level_surf = main_font.render(f"Level: {level}", True, UI_TEXT_COLOR)
+        level_rect = level_surf.get_frect(topleft=(20, 20))
+        _level_text_cache = (level, level_surf, level_rect)
+    _, level_surf, level_rect = _level_text_cache
     surface.blit(level_surf, level_rect)
 
     # Display hearts at top right
-    heart_spacing = 40  # Pixels between hearts
-    for i in range(INITIAL_LIVES):
+    for i, heart_rect in enumerate(HEART_RECTS):
         # Choose heart image based on current lives
         heart_surf = heart_full_surf if i < lives else heart_empty_surf
 
-        # Position hearts right-aligned with spacing
-        heart_x = WINDOW_WIDTH - (heart_spacing * (INITIAL_LIVES - i))
-        heart_y = 20
-        heart_rect = heart_surf.get_frect(topright=(heart_x, heart_y))
-
         # Draw heart
         surface.blit(heart_surf, heart_rect)
 
 
+# The game-over screen redraws every frame while waiting for input, so the
+# static parts (dim overlay, headline, restart hint) are baked once on first
+# use and the final-score text is cached per score value
+_game_over_overlay = None
+_final_score_cache = (None, None, None)  # (score, surface, rect)
+
+
 def show_game_over_screen(surface, final_score):
     """Display game over screen with final score"""
-    # Create semi-transparent overlay
-    overlay = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT), pygame.SRCALPHA)
-    overlay.fill((0, 0, 0, 180))  # Black with alpha
-    surface.blit(overlay, (0, 0))
-
-    # Game over text
-    game_over_surf = game_over_font.render("GAME OVER", True, "#ff3333")
-    game_over_rect = game_over_surf.get_frect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 - 50))
-    surface.blit(game_over_surf, game_over_rect)
-
-    # Final score text
-    score_surf = main_font.render(f"Final Score: {final_score}", True, "#ffffff")
-    score_rect = score_surf.get_frect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 + 30))
-    surface.blit(score_surf, score_rect)
+    global _game_over_overlay, _final_score_cache
+
+    # Build the static overlay once: dim rectangle plus unchanging text
+    if _game_over_overlay is None:
+        overlay = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT), pygame.SRCALPHA)
+        overlay.fill((0, 0, 0, 180))  # Black with alpha
+
+        # Game over text
+        game_over_surf = game_over_font.render("GAME OVER", True, "#ff3333")
+        game_over_rect = game_over_surf.get_frect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 - 50))
+        overlay.blit(game_over_surf, game_over_rect)
 
-    # Restart instructions
-    restart_surf = main_font.render("Press SPACE to Play Again or ESC to Quit", True, "#cccccc")
-    restart_rect = restart_surf.get_frect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 + 100))
-    surface.blit(restart_surf, restart_rect)
+        # Restart instructions
+        restart_surf = main_font.render("Press SPACE to Play Again or ESC to Quit", True, "#cccccc")
+        restart_rect = restart_surf.get_frect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 + 100))
+        overlay.blit(restart_surf, restart_rect)
+
+        _game_over_overlay = overlay.convert_alpha()
+
+    surface.blit(_game_over_overlay, (0, 0))
+
+    # Final score text (re-rendered only when the score value differs)
+    if _final_score_cache[0] != final_score:
+        score_surf = main_font.render(f"Final Score: {final_score}", True, "#ffffff")
+        score_rect = score_surf.get_frect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 + 30))
+        _final_score_cache = (final_score, score_surf, score_rect)
+    surface.blit(_final_score_cache[1], _final_score_cache[2])
 
 
 def run_game():
     """Main game loop function"""
-    # Create sprite groups
-    global all_sprites, meteor_sprites, laser_sprites
-    all_sprites = pygame.sprite.Group()
-    meteor_sprites = pygame.sprite.Group()
-    laser_sprites = pygame.sprite.Group()
+    # Meteors and lasers are uniform, short-lived objects, so they live in
+    # plain lists (append to spawn, compact on the alive flag) instead of
+    # paying pygame.sprite.Group's dict bookkeeping; explosions keep a
+    # Group for its draw/kill plumbing
+    global meteor_sprites, laser_sprites, explosion_sprites
+    meteor_sprites = []
+    laser_sprites = []
+    explosion_sprites = pygame.sprite.Group()
 
     # Create player
     player = Player()
 
-    # Create background stars
-    spawn_stars(20)
+    # Bake the starfield into a static background surface
+    background_surf = create_background(20)
 
     # Game state variables
     score = 0
     level = 1
-    last_score_update = pygame.time.get_ticks()
 
-    # Initial meteor spawn timer
+    # Arm the recurring timers; spawn interval is re-armed on level change.
+    # A 0 ms interval would disable an SDL timer, and anything shorter than
+    # a frame would queue several spawn events per frame, so clamp to the
+    # frame period — matching the old poll's one-spawn-per-frame ceiling.
     meteor_spawn_rate = calculate_meteor_spawn_time(level)
-    meteor_timer = pygame.time.get_ticks()
+    pygame.time.set_timer(METEOR_SPAWN_EVENT, max(meteor_spawn_rate, 1000 // FPS))
+    pygame.time.set_timer(SURVIVAL_SCORE_EVENT, 1000)
 
     # Game loop
     running = True
@@ -483,69 +622,86 @@ def run_game():
         dt = clock.tick(FPS) / 1000  # Convert milliseconds to seconds
         current_time = pygame.time.get_ticks()
 
+        # Poll keyboard state once per frame and reuse everywhere
+        keys = pygame.key.get_pressed()
+        just_pressed = pygame.key.get_just_pressed()
+
         # Event handling
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 running = False
 
-            # Game over screen controls
-            if game_over:
-                keys = pygame.key.get_pressed()
-                if keys[pygame.K_SPACE]:
-                    # Restart the game
-                    return True  # Signal to restart
-                if keys[pygame.K_ESCAPE]:
-                    return False  # Signal to quit
+            # Timer-driven meteor spawning (paused while the game is over)
+            elif event.type == METEOR_SPAWN_EVENT and not game_over:
+                # Calculate speed multiplier based on level (more speed at higher levels)
+                speed_multiplier = 1.0 + (level - 1) * 0.1  # 10% increase per level
+
+                # Create new meteor
+                meteor_sprites.append(Meteor(speed_multiplier))
+
+            # Passive score increase (survival points, once per second)
+            elif event.type == SURVIVAL_SCORE_EVENT and not game_over:
+                score += SURVIVAL_POINTS_PER_SECOND
 
         # Skip game logic if game is over
         if game_over:
-            # Draw all sprites (background elements)
-            display_surface.fill(BACKGROUND_COLOR)
-            all_sprites.draw(display_surface)
+            # Game over screen controls
+            if keys[pygame.K_SPACE]:
+                # Restart the game
+                return True  # Signal to restart
+            if keys[pygame.K_ESCAPE]:
+                return False  # Signal to quit
+            # Draw the frozen scene behind the overlay
+            display_surface.blit(background_surf, (0, 0))
+            display_surface.fblits(
+                [(laser.image, laser.rect) for laser in laser_sprites], pygame.BLEND_PREMULTIPLIED)
+            display_surface.fblits([(meteor.image, meteor.rect) for meteor in meteor_sprites])
+            display_surface.fblits(
+                [(exp.image, exp.rect) for exp in explosion_sprites], pygame.BLEND_PREMULTIPLIED)
             display_surface.blit(player.image, player.rect)
 
             # Show game over screen
             show_game_over_screen(display_surface, score)
             pygame.display.update()
             continue
-        # Clear screen
-        display_surface.fill(BACKGROUND_COLOR)
+        # Clear screen with the pre-baked starfield background
+        display_surface.blit(background_surf, (0, 0))
 
         # Update current level based on score
         level = get_current_level(score)  # +1 because levels are 1-based for display
 
-        # Passive score increase (survival points)
-        if current_time - last_score_update >= 1000:  # Every second
-            score += SURVIVAL_POINTS_PER_SECOND
-            last_score_update = current_time
-
-        # Spawn meteors on timer
-        if current_time - meteor_timer >= meteor_spawn_rate:
-            # Calculate speed multiplier based on level (more speed at higher levels)
-            speed_multiplier = 1.0 + (level - 1) * 0.1  # 10% increase per level
-
-            # Create new meteor
-            Meteor(meteor_surf, (all_sprites, meteor_sprites), speed_multiplier)
-
-            # Reset timer
-            meteor_timer = current_time
-
-            # Update spawn rate based on current level
-            meteor_spawn_rate = calculate_meteor_spawn_time(level)
+        # Re-arm the spawn timer with the new interval when the level changes
+        new_spawn_rate = calculate_meteor_spawn_time(level)
+        if new_spawn_rate != meteor_spawn_rate:
+            meteor_spawn_rate = new_spawn_rate
+            pygame.time.set_timer(METEOR_SPAWN_EVENT, max(meteor_spawn_rate, 1000 // FPS))
 
         # Update all sprites
-        player.update(dt, level)  # Pass current level to player for laser cooldown adjustment
-        all_sprites.update(dt)
+        player.update(dt, current_time, level, keys, just_pressed)  # Level adjusts laser cooldown
+        for laser in laser_sprites:
+            laser.update(dt, current_time)
+        for meteor in meteor_sprites:
+            meteor.update(dt, current_time)
+        explosion_sprites.update(dt, current_time)
 
         # Handle collisions and update score
         score = check_collisions(player, score)
 
+        # Compact the lists, dropping everything flagged dead this frame
+        laser_sprites[:] = [laser for laser in laser_sprites if laser.alive]
+        meteor_sprites[:] = [meteor for meteor in meteor_sprites if meteor.alive]
+
         # Check if player is still alive
         if not player.alive:
             game_over = True
 
-        # Draw everything
-        all_sprites.draw(display_surface)
+        # Draw everything in one fblits call per kind; lasers and explosions
+        # are premultiplied at load, so they use the SIMD blend path
+        display_surface.fblits(
+            [(laser.image, laser.rect) for laser in laser_sprites], pygame.BLEND_PREMULTIPLIED)
+        display_surface.fblits([(meteor.image, meteor.rect) for meteor in meteor_sprites])
+        display_surface.fblits(
+            [(exp.image, exp.rect) for exp in explosion_sprites], pygame.BLEND_PREMULTIPLIED)
         display_surface.blit(player.image, player.rect)
         display_ui(display_surface, score, level, player.lives)
 